@@ -107,6 +107,7 @@ setup(
     extras_require={
         "testing": [
             "pytest",
+            "pytest-xdist",
             "json-schema-for-humans",
             "mongomock",
         ],
@@ -122,6 +123,7 @@ setup(
             # other requirements
             "pytest",  # test framework
             "pytest-cov",  # code coverage
+            "pytest-xdist",  # parallel test runs
             "mongomock", # mongodb mocking for testing
         ],
     },
@@ -1,7 +1,7 @@
 import contextlib
 import enum
 from pathlib import Path
-from typing import Container, Optional, Callable
+from typing import Container, Optional, Callable, List
 
 import pytest
 from _pytest.nodes import Item
@@ -12,6 +12,7 @@ from _pytest.config.argparsing import Parser
 class MarkerSpec(enum.Enum):
     unit = "Quick tests that do not require a solver, must run in < 2 s"
     component = "Quick tests that may require a solver"
+    solver = "Tests that require a solver"
     integration = "Long duration tests"
     build = "FIXME for building stuff?"
     requires_idaes_solver = "Tests that require a solver from the IDEAS extensions to pass"
@@ -43,6 +44,13 @@ def _handle_requires_idaes_solver(solver: Optional = None, action: Optional[Call
         )
 
 
+@pytest.fixture(scope="session")
+def solver():
+    from idaes.core.util import get_solver
+
+    return get_solver()
+
+
 def pytest_configure(config: Config):
 
     for marker_spec in MarkerSpec:
@@ -58,6 +66,17 @@ def pytest_runtest_setup(item: Item):
         _handle_requires_idaes_solver()
 
 
+def pytest_collection_modifyitems(config: Config, items: List[Item]):
+
+    if config.getoption("runslow"):
+        return
+
+    skip_component = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if MarkerSpec.component in MarkerSpec.for_item(item):
+            item.add_marker(skip_component)
+
+
 def pytest_addoption(parser: Parser):
     parser.addoption(
         "--edb-no-mock",
@@ -67,3 +86,10 @@ def pytest_addoption(parser: Parser):
         default=False,
         dest="edb_no_mock",
     )
+    parser.addoption(
+        "--runslow",
+        help="Run the tests marked as `component`, which are skipped by default",
+        action="store_true",
+        default=False,
+        dest="runslow",
+    )
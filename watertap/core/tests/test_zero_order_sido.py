@@ -13,14 +13,18 @@
 """
 Tests for general zero-order property package
 """
+from collections import namedtuple
+import gc
+from math import isclose
+import numpy as np
 import pytest
 from io import StringIO
 
 from idaes.core import declare_process_block_class, FlowsheetBlock
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.testing import initialization_tester
-from idaes.core.util import get_solver
 import idaes.core.util.scaling as iscale
+from pyomo.common.collections import ComponentMap
 from pyomo.environ import (check_optimal_termination,
                            ConcreteModel,
                            Constraint,
@@ -34,7 +38,27 @@ from watertap.core import WaterParameterBlock, WaterStateBlock, ZeroOrderBaseDat
 from watertap.core.zero_order_sido import (
     build_sido, initialize_sido, calculate_scaling_factors_sido, _get_Q_sido)
 
-solver = get_solver()
+
+SOLUTES = ("A", "B", "C")
+INLET_FLOW_MASS = {"H2O": 1000, "A": 10, "B": 20, "C": 30}
+RECOVERY_FRAC_MASS_H2O = 0.8
+REMOVAL_FRAC_MASS = {"A": 0.1, "B": 0.2, "C": 0.3}
+
+COMPONENT_TYPES = (Port, Var, Constraint)
+EXPECTED_COMPONENTS = {
+    "inlet": (Port, 1),
+    "treated": (Port, 1),
+    "byproduct": (Port, 1),
+    "recovery_frac_mass_H2O": (Var, 1),
+    "removal_frac_mass_solute": (Var, 3),
+    "water_recovery_equation": (Constraint, 1),
+    "water_balance": (Constraint, 1),
+    "solute_removal_equation": (Constraint, 3),
+    "solute_treated_equation": (Constraint, 3)}
+
+
+# Solved mass flows of each component, keyed by port name
+SIDOSolution = namedtuple("SIDOSolution", ["inlet", "treated", "byproduct"])
 
 
 @declare_process_block_class("DerivedSIDO")
@@ -45,141 +69,173 @@ class DerivedSIDOData(ZeroOrderBaseData):
         build_sido(self)
 
 
+def _free_model(m):
+    # Break the reference cycles between the blocks and their scaling
+    # suffixes so the model is freed once the fixture is torn down
+    m.del_component(m.fs)
+    gc.collect()
+
+
 class TestSIDO:
     @pytest.fixture(scope="module")
-    def model(self):
+    def base_model(self):
         m = ConcreteModel()
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
 
         m.fs.water_props = WaterParameterBlock(
-            default={"solute_list": ["A", "B", "C"]})
+            default={"solute_list": list(SOLUTES)})
 
         m.fs.unit = DerivedSIDO(
             default={"property_package": m.fs.water_props})
 
-        m.fs.unit.inlet.flow_mass_comp[0, "H2O"].fix(1000)
-        m.fs.unit.inlet.flow_mass_comp[0, "A"].fix(10)
-        m.fs.unit.inlet.flow_mass_comp[0, "B"].fix(20)
-        m.fs.unit.inlet.flow_mass_comp[0, "C"].fix(30)
+        for j, v in INLET_FLOW_MASS.items():
+            m.fs.unit.inlet.flow_mass_comp[0, j].fix(v)
+
+        m.fs.unit.recovery_frac_mass_H2O.fix(RECOVERY_FRAC_MASS_H2O)
+        for j, v in REMOVAL_FRAC_MASS.items():
+            m.fs.unit.removal_frac_mass_solute[0, j].fix(v)
 
-        m.fs.unit.recovery_frac_mass_H2O.fix(0.8)
-        m.fs.unit.removal_frac_mass_solute[0, "A"].fix(0.1)
-        m.fs.unit.removal_frac_mass_solute[0, "B"].fix(0.2)
-        m.fs.unit.removal_frac_mass_solute[0, "C"].fix(0.3)
+        # Scale before any solve so that Ipopt can use the user scaling
+        iscale.calculate_scaling_factors(m)
 
-        return m
+        yield m
+
+        _free_model(m)
+
+    @pytest.fixture
+    def model(self, base_model):
+        # Tests that change the model work on a copy of the base model
+        m = base_model.clone()
+
+        yield m
+
+        _free_model(m)
+
+    @pytest.fixture(scope="module")
+    def solved_model(self, base_model, solver):
+        model = base_model.clone()
+
+        # ipopt-watertap defaults to nlp_scaling_method=user-scaling, so this
+        # solve uses the scaling factors calculated in base_model
+        results = solver.solve(model)
+
+        yield model, results
+
+        _free_model(model)
+
+    @pytest.fixture(scope="module")
+    def solution(self, solved_model):
+        model, _ = solved_model
+
+        return SIDOSolution(**{
+            port: {j: value(v)
+                   for (t, j), v in getattr(
+                       model.fs.unit, port).flow_mass_comp.items()}
+            for port in SIDOSolution._fields})
+
+    @pytest.fixture(scope="module")
+    def scaling_factors(self, base_model):
+        return ComponentMap(
+            (c, iscale.get_constraint_transform_applied_scaling_factor(c))
+            for c in base_model.fs.unit.component_data_objects(Constraint))
 
     @pytest.mark.unit
-    def test_private_attributes(self, model):
-        assert model.fs.unit._tech_type is None
-        assert model.fs.unit._has_recovery_removal is True
-        assert model.fs.unit._fixed_perf_vars == []
-        assert model.fs.unit._initialize is initialize_sido
-        assert model.fs.unit._scaling is calculate_scaling_factors_sido
-        assert model.fs.unit._get_Q is _get_Q_sido
-        assert model.fs.unit._stream_table_dict == {
-            "Inlet": model.fs.unit.inlet,
-            "Treated": model.fs.unit.treated,
-            "Byproduct": model.fs.unit.byproduct}
-        assert model.fs.unit._perf_var_dict == {
-            "Water Recovery": model.fs.unit.recovery_frac_mass_H2O,
-            "Solute Removal": model.fs.unit.removal_frac_mass_solute}
+    def test_private_attributes(self, base_model):
+        assert base_model.fs.unit._tech_type is None
+        assert base_model.fs.unit._has_recovery_removal is True
+        assert base_model.fs.unit._fixed_perf_vars == []
+        assert base_model.fs.unit._initialize is initialize_sido
+        assert base_model.fs.unit._scaling is calculate_scaling_factors_sido
+        assert base_model.fs.unit._get_Q is _get_Q_sido
+        assert base_model.fs.unit._stream_table_dict == {
+            "Inlet": base_model.fs.unit.inlet,
+            "Treated": base_model.fs.unit.treated,
+            "Byproduct": base_model.fs.unit.byproduct}
+        assert base_model.fs.unit._perf_var_dict == {
+            "Water Recovery": base_model.fs.unit.recovery_frac_mass_H2O,
+            "Solute Removal": base_model.fs.unit.removal_frac_mass_solute}
 
     @pytest.mark.unit
-    def test_build(self, model):
-        assert isinstance(model.fs.unit.properties_in, WaterStateBlock)
-        assert isinstance(model.fs.unit.properties_treated, WaterStateBlock)
-        assert isinstance(model.fs.unit.properties_byproduct, WaterStateBlock)
-
-        assert isinstance(model.fs.unit.inlet, Port)
-        assert isinstance(model.fs.unit.treated, Port)
-        assert isinstance(model.fs.unit.byproduct, Port)
-
-        assert isinstance(model.fs.unit.recovery_frac_mass_H2O, Var)
-        assert len(model.fs.unit.recovery_frac_mass_H2O) == 1
-        assert isinstance(model.fs.unit.removal_frac_mass_solute, Var)
-        assert len(model.fs.unit.removal_frac_mass_solute) == 3
-
-        assert isinstance(model.fs.unit.water_recovery_equation, Constraint)
-        assert len(model.fs.unit.water_recovery_equation) == 1
-        assert isinstance(model.fs.unit.water_balance, Constraint)
-        assert len(model.fs.unit.water_balance) == 1
-        assert isinstance(model.fs.unit.solute_removal_equation, Constraint)
-        assert len(model.fs.unit.solute_removal_equation) == 3
-        assert isinstance(model.fs.unit.solute_treated_equation, Constraint)
-        assert len(model.fs.unit.solute_treated_equation) == 3
+    def test_build(self, base_model):
+        assert all(isinstance(getattr(base_model.fs.unit, n), WaterStateBlock)
+                   for n in ("properties_in",
+                             "properties_treated",
+                             "properties_byproduct"))
+
+        # Skip the private References add_port creates for the port members
+        components = {
+            c.local_name: (c.ctype, len(c))
+            for c in base_model.fs.unit.component_objects(
+                COMPONENT_TYPES, descend_into=False)
+            if not c.local_name.startswith("_")}
+        assert components == EXPECTED_COMPONENTS
 
     @pytest.mark.unit
-    def test_degrees_of_freedom(self, model):
-        assert degrees_of_freedom(model) == 0
+    def test_degrees_of_freedom(self, base_model):
+        assert degrees_of_freedom(base_model) == 0
 
     @pytest.mark.component
-    def test_unit_consistency(self, model):
-        assert_units_consistent(model)
-
+    def test_unit_consistency(self, base_model):
+        assert_units_consistent(base_model.fs.unit)
+
+    @pytest.mark.parametrize("cname, index", [
+        ("water_recovery_equation", 0),
+        ("water_balance", 0),
+        ("solute_removal_equation", (0, "A")),
+        ("solute_removal_equation", (0, "B")),
+        ("solute_removal_equation", (0, "C")),
+        ("solute_treated_equation", (0, "A")),
+        ("solute_treated_equation", (0, "B")),
+        ("solute_treated_equation", (0, "C"))])
     @pytest.mark.component
-    def test_scaling(self, model):
-        iscale.calculate_scaling_factors(model)
-
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.water_recovery_equation[0]) == 1e5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.water_balance[0]) == 1e5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.solute_removal_equation[0, "A"]) == 1e5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.solute_removal_equation[0, "B"]) == 1e5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.solute_removal_equation[0, "C"]) == 1e5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.solute_treated_equation[0, "A"]) == 1e5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.solute_treated_equation[0, "B"]) == 1e5
-        assert iscale.get_constraint_transform_applied_scaling_factor(
-            model.fs.unit.solute_treated_equation[0, "C"]) == 1e5
+    def test_scaling(self, base_model, scaling_factors, cname, index):
+        assert scaling_factors[getattr(base_model.fs.unit, cname)[index]] == 1e5
 
     @pytest.mark.component
     def test_initialization(self, model):
-        initialization_tester(model)
+        # The material balances are linear, so Ipopt should stop as soon as
+        # the acceptable tolerance is met rather than iterating to 1e-8
+        initialization_tester(model, optarg={"tol": 1e-6,
+                                             "max_iter": 50,
+                                             "acceptable_tol": 1e-6,
+                                             "acceptable_iter": 3,
+                                             "print_level": 0})
 
     @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    def test_solve(self, solved_model):
+        model, results = solved_model
 
         # Check for optimal solution
         assert check_optimal_termination(results)
 
+    @pytest.mark.parametrize("port, j, expected", [
+        ("treated", "H2O", 800),
+        ("byproduct", "H2O", 200),
+        ("treated", "A", 9),
+        ("byproduct", "A", 1),
+        ("treated", "B", 16),
+        ("byproduct", "B", 4),
+        ("treated", "C", 21),
+        ("byproduct", "C", 9)])
     @pytest.mark.component
-    def test_solution(self, model):
-        assert (pytest.approx(800, rel=1e-5) ==
-                value(model.fs.unit.treated.flow_mass_comp[0, "H2O"]))
-        assert (pytest.approx(200, rel=1e-5) ==
-                value(model.fs.unit.byproduct.flow_mass_comp[0, "H2O"]))
-
-        assert (pytest.approx(9, rel=1e-5) ==
-                value(model.fs.unit.treated.flow_mass_comp[0, "A"]))
-        assert (pytest.approx(1, rel=1e-5) ==
-                value(model.fs.unit.byproduct.flow_mass_comp[0, "A"]))
-        assert (pytest.approx(16, rel=1e-5) ==
-                value(model.fs.unit.treated.flow_mass_comp[0, "B"]))
-        assert (pytest.approx(4, rel=1e-5) ==
-                value(model.fs.unit.byproduct.flow_mass_comp[0, "B"]))
-        assert (pytest.approx(21, rel=1e-5) ==
-                value(model.fs.unit.treated.flow_mass_comp[0, "C"]))
-        assert (pytest.approx(9, rel=1e-5) ==
-                value(model.fs.unit.byproduct.flow_mass_comp[0, "C"]))
+    def test_solution(self, solution, port, j, expected):
+        actual = getattr(solution, port)[j]
+        assert isclose(actual, expected, rel_tol=1e-5), (
+            f"{port}.flow_mass_comp[0, {j}] is {actual}, expected {expected}")
 
     @pytest.mark.component
-    def test_conservation(self, model):
-        for (t, j) in model.fs.unit.inlet.flow_mass_comp.keys():
-            assert (abs(value(model.fs.unit.inlet.flow_mass_comp[t, j] -
-                              model.fs.unit.treated.flow_mass_comp[t, j] -
-                              model.fs.unit.byproduct.flow_mass_comp[t, j]))
-                    <= 1e-6)
+    def test_conservation(self, solution):
+        imbalance = np.array([solution.inlet[j] -
+                              solution.treated[j] -
+                              solution.byproduct[j]
+                              for j in solution.inlet])
+        assert np.allclose(imbalance, 0, atol=1e-6)
 
     @pytest.mark.component
-    def test_report(self, model):
+    def test_report(self, solved_model):
+        model, _ = solved_model
+
         stream = StringIO()
         model.fs.unit.report(ostream=stream)
 
@@ -120,6 +120,9 @@ class Database:
         """
         Method to retrieve parameters for a given technology by subtype.
 
+        The technology file is read from disk on first use and cached on the
+        Database object, so repeated calls only copy the cached data.
+
         Args:
             technology - unit operation technology to look up and retrieve
                          parameters for.
@@ -144,7 +147,8 @@ class Database:
             pass
         elif isinstance(subtype, str):
             try:
-                sparams.update(params[subtype])
+                # copy so callers cannot modify the cached file data
+                sparams.update(deepcopy(params[subtype]))
             except KeyError:
                 raise KeyError(
                     f"Received unrecognised subtype {subtype} for technology "
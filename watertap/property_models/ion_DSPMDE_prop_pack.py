@@ -17,6 +17,7 @@ Donnan Steric Pore Model with Dielectric Exclusion (DSPM-DE)
 
 # Import Python libraries
 import idaes.logger as idaeslog
+import numpy as np
 
 from enum import Enum, auto
 # Import Pyomo libraries
@@ -41,13 +42,26 @@ from idaes.core.util.initialization import (fix_state_vars,
 from idaes.core.util.misc import add_object_reference, extract_data
 from idaes.core.util import get_solver
 from idaes.core.util.model_statistics import degrees_of_freedom, \
-    number_unfixed_variables
+    number_unfixed_variables, number_activated_equalities
 from idaes.core.util.exceptions import ConfigurationError, InitializationError
 import idaes.core.util.scaling as iscale
 
 # Set up logger
 _log = idaeslog.getLogger(__name__)
 
+# properties built as Expressions and the Var to fix in calculate_state instead
+_calculate_state_var_hint = {
+    'conc_mass_phase_comp': "Use conc_mol_phase_comp instead.",
+    'flow_mass_phase_comp': "Use flow_mol_phase_comp instead.",
+}
+
+
+def _electroneutrality_residual(charges, flows):
+    """
+    Net charge flow for arrays of solute charges and molar flows.
+    """
+    return float(np.dot(charges, flows))
+
 
 class ActivityCoefficientModel(Enum):
     ideal = auto()                    # Ideal
@@ -107,6 +121,9 @@ class DSPMDEParameterData(PhysicalParameterBlock):
         for j in self.config.solute_list:
             self.add_component(str(j), Solute())
 
+        # component classification reused when scaling each state block
+        self._solvent_components = frozenset(self.solvent_set)
+
         # phases
         self.Liq = LiquidPhase()
 
@@ -177,6 +194,8 @@ class DSPMDEParameterData(PhysicalParameterBlock):
              'temperature': {'method': None},
              'pressure': {'method': None},
              'flow_mass_phase_comp': {'method': '_flow_mass_phase_comp'},
+             'flow_mass_phase': {'method': '_flow_mass_phase'},
+             'flow_mol_phase': {'method': '_flow_mol_phase'},
              'mass_frac_phase_comp': {'method': '_mass_frac_phase_comp'},
              'dens_mass_phase': {'method': '_dens_mass_phase'},
              'flow_vol_phase': {'method': '_flow_vol_phase'},
@@ -262,8 +281,15 @@ class _DSPMDEStateBlock(StateBlock):
         # Fix state variables
         flags = fix_state_vars(self, state_args)
         # Check when the state vars are fixed already result in dof 0
+        # and whether any property variables remain to be solved for
+        skip_solve = True  # skip solve if only state variables are present
         for k in self.keys():
-            dof = degrees_of_freedom(self[k])
+            if number_unfixed_variables(self[k]) == 0:
+                # with every variable fixed, only the active equalities count
+                dof = -number_activated_equalities(self[k])
+            else:
+                skip_solve = False
+                dof = degrees_of_freedom(self[k])
             if dof != 0:
                 raise InitializationError("\nWhile initializing {sb_name}, the degrees of freedom "
                                            "are {dof}, when zero is required. \nInitialization assumes "
@@ -275,11 +301,6 @@ class _DSPMDEStateBlock(StateBlock):
                                            "".format(sb_name=self.name, dof=dof))
 
         # ---------------------------------------------------------------------
-        skip_solve = True  # skip solve if only state variables are present
-        for k in self.keys():
-            if number_unfixed_variables(self[k]) != 0:
-                skip_solve = False
-
         if not skip_solve:
             # Initialize properties
             with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
@@ -316,13 +337,14 @@ class _DSPMDEStateBlock(StateBlock):
                         solver=None, optarg=None):
         """
         Solves state blocks given a set of variables and their values. These variables can
-        be state variables or properties. This method is typically used before
-        initialization to solve for state variables because non-state variables (i.e. properties)
-        cannot be fixed in initialization routines.
+        be state variables or properties that are Vars; properties built as Expressions
+        (e.g. conc_mass_phase_comp, flow_mass_phase_comp) cannot be fixed and are rejected.
+        This method is typically used before initialization to solve for state variables
+        because non-state variables (i.e. properties) cannot be fixed in initialization routines.
 
         Keyword Arguments:
-            var_args : dictionary with variables and their values, they can be state variables or properties
-                       {(VAR_NAME, INDEX): VALUE}
+            var_args : dictionary with variables and their values, they can be state variables or
+                       properties that are Vars {(VAR_NAME, INDEX): VALUE}
             hold_state : flag indicating whether all of the state variables should be fixed after calculate state.
                          True - State variables will be fixed.
                          False - State variables will remain unfixed, unless already fixed.
@@ -337,6 +359,18 @@ class _DSPMDEStateBlock(StateBlock):
         # Get logger
         solve_log = idaeslog.getSolveLogger(self.name, level=outlvl, tag="properties")
 
+        # Only Vars can be fixed, check before initializing
+        var_name_set = {v_name for (v_name, _ind) in var_args}
+        sb0 = self[next(iter(self.keys()))]
+        for v_name in var_name_set:
+            if not isinstance(getattr(sb0, v_name), Var):
+                raise ConfigurationError(
+                    "While using the calculate_state method on {sb_name}, {v_name} was provided "
+                    "in var_args, but it is not a Var and cannot be fixed. {hint}"
+                    "".format(sb_name=sb0.name, v_name=v_name,
+                              hint=_calculate_state_var_hint.get(
+                                  v_name, "Provide a state variable or a property that is a Var.")))
+
         # Initialize at current state values (not user provided)
         self.initialize(solver=solver, optarg=optarg, outlvl=outlvl)
 
@@ -345,10 +379,12 @@ class _DSPMDEStateBlock(StateBlock):
 
         # Fix variables and check degrees of freedom
         flags = {}  # dictionary noting which variables were fixed and their previous state
+
         for k in self.keys():
             sb = self[k]
+            var_map = {v_name: getattr(sb, v_name) for v_name in var_name_set}
             for (v_name, ind), val in var_args.items():
-                var = getattr(sb, v_name)
+                var = var_map[v_name]
                 if iscale.get_scaling_factor(var[ind]) is None:
                     _log.warning(
                             "While using the calculate_state method on {sb_name}, variable {v_name} "
@@ -407,8 +443,15 @@ class DSPMDEStateBlockData(StateBlockData):
         """Callable method for Block construction."""
         super().build()
 
+        # iscale stores and looks up scaling factors on the Suffix of each component's
+        # parent block, i.e. this element, so a single Suffix on the indexed container
+        # would not be found
         self.scaling_factor = Suffix(direction=Suffix.EXPORT)
 
+        # cache the component sets so property rules do not re-iterate the Pyomo sets
+        self._comp_tuple = tuple(self.params.component_list)
+        self._solute_tuple = tuple(self.params.solute_set)
+
         # Add state variables
         self.flow_mol_phase_comp = Var(
             self.params.phase_list,
@@ -446,21 +489,18 @@ class DSPMDEStateBlockData(StateBlockData):
 
         def rule_mass_frac_phase_comp(b, j):
             return (b.mass_frac_phase_comp['Liq', j] == b.flow_mass_phase_comp['Liq', j] /
-                    sum(b.flow_mass_phase_comp['Liq', j]
-                        for j in self.params.component_list))
+                    b.flow_mass_phase['Liq'])
         self.eq_mass_frac_phase_comp = Constraint(self.params.component_list, rule=rule_mass_frac_phase_comp)
 
     def _dens_mass_phase(self):
-        self.dens_mass_phase = Var(
+        #TODO: reconsider this approach for solution density based on arbitrary solute_list
+        # the density is constant, so it is an Expression rather than a Var fixed by a Constraint
+        def rule_dens_mass_phase(b, p):
+            return 1000 * pyunits.kg * pyunits.m**-3
+        self.dens_mass_phase = Expression(
             ['Liq'],
-            initialize=1e3,
-            bounds=(5e2, 2e3),
-            units=pyunits.kg * pyunits.m ** -3,
+            rule=rule_dens_mass_phase,
             doc="Mass density")
-        #TODO: reconsider this approach for solution density based on arbitrary solute_list
-        def rule_dens_mass_phase(b):
-            return (b.dens_mass_phase['Liq'] == 1000 * pyunits.kg * pyunits.m**-3)
-        self.eq_dens_mass_phase = Constraint(rule=rule_dens_mass_phase)
 
     def _flow_vol_phase(self):
         self.flow_vol_phase = Var(
@@ -472,11 +512,14 @@ class DSPMDEStateBlockData(StateBlockData):
 
         def rule_flow_vol_phase(b):
             return (b.flow_vol_phase['Liq']
-                    == sum(b.flow_mol_phase_comp['Liq', j]*b.mw_comp[j] for j in self.params.component_list)
-                    / b.dens_mass_phase['Liq'])
+                    == b.flow_mass_phase['Liq'] / b.dens_mass_phase['Liq'])
         self.eq_flow_vol_phase = Constraint(rule=rule_flow_vol_phase)
 
     def _flow_vol(self):
+        if len(self.params.phase_list) == 1:
+            # a single liquid phase carries all of the volumetric flow
+            self.flow_vol = Expression(expr=self.flow_vol_phase['Liq'])
+            return
 
         def rule_flow_vol(b):
             return sum(b.flow_vol_phase[p] for p in self.params.phase_list)
@@ -492,37 +535,41 @@ class DSPMDEStateBlockData(StateBlockData):
             doc="Molar concentration")
 
         def rule_conc_mol_phase_comp(b, j):
-            return (b.conc_mol_phase_comp['Liq', j] * b.params.mw_comp[j] ==
-                    b.conc_mass_phase_comp['Liq', j])
+            return (b.conc_mol_phase_comp['Liq', j] * b.mw_comp[j] ==
+                    b.dens_mass_phase['Liq'] * b.mass_frac_phase_comp['Liq', j])
         self.eq_conc_mol_phase_comp = Constraint(self.params.component_list, rule=rule_conc_mol_phase_comp)
 
     def _conc_mass_phase_comp(self):
-        self.conc_mass_phase_comp = Var(
+
+        def rule_conc_mass_phase_comp(b, p, j):
+            return b.conc_mol_phase_comp[p, j] * b.mw_comp[j]
+        self.conc_mass_phase_comp = Expression(
             self.params.phase_list,
             self.params.component_list,
-            initialize=10,
-            bounds=(1e-3, 2e3),
-            units=pyunits.kg * pyunits.m ** -3,
+            rule=rule_conc_mass_phase_comp,
             doc="Mass concentration")
 
-        def rule_conc_mass_phase_comp(b, j):
-            return (b.conc_mass_phase_comp['Liq', j] ==
-                    b.dens_mass_phase['Liq'] * b.mass_frac_phase_comp['Liq', j])
-        self.eq_conc_mass_phase_comp = Constraint(self.params.component_list, rule=rule_conc_mass_phase_comp)
-
     def _flow_mass_phase_comp(self):
-        self.flow_mass_phase_comp = Var(
+
+        def rule_flow_mass_phase_comp(b, p, j):
+            return b.flow_mol_phase_comp[p, j] * b.mw_comp[j]
+        self.flow_mass_phase_comp = Expression(
             self.params.phase_list,
             self.params.component_list,
-            initialize=100,
-            bounds=(1e-8, None),
-            units=pyunits.kg / pyunits.s,
+            rule=rule_flow_mass_phase_comp,
             doc="Component Mass flowrate")
 
-        def rule_flow_mass_phase_comp(b, j):
-            return (b.flow_mass_phase_comp['Liq', j] ==
-                    b.flow_mol_phase_comp['Liq', j] * b.params.mw_comp[j])
-        self.eq_flow_mass_phase_comp = Constraint(self.params.component_list, rule=rule_flow_mass_phase_comp)
+    def _flow_mass_phase(self):
+
+        def rule_flow_mass_phase(b, p):
+            return sum(b.flow_mol_phase_comp[p, j] * b.mw_comp[j] for j in b._comp_tuple)
+        self.flow_mass_phase = Expression(self.params.phase_list, rule=rule_flow_mass_phase)
+
+    def _flow_mol_phase(self):
+
+        def rule_flow_mol_phase(b, p):
+            return sum(b.flow_mol_phase_comp[p, j] for j in b._comp_tuple)
+        self.flow_mol_phase = Expression(self.params.phase_list, rule=rule_flow_mol_phase)
 
     def _mole_frac_phase_comp(self):
         self.mole_frac_phase_comp = Var(
@@ -535,7 +582,7 @@ class DSPMDEStateBlockData(StateBlockData):
 
         def rule_mole_frac_phase_comp(b, j):
             return (b.mole_frac_phase_comp['Liq', j] == b.flow_mol_phase_comp['Liq', j] /
-                    sum(b.flow_mol_phase_comp['Liq', j] for j in b.params.component_list))
+                    b.flow_mol_phase['Liq'])
         self.eq_mole_frac_phase_comp = Constraint(self.params.component_list, rule=rule_mole_frac_phase_comp)
 
     def _molality_comp(self):
@@ -546,11 +593,15 @@ class DSPMDEStateBlockData(StateBlockData):
             units=pyunits.mole / pyunits.kg,
             doc="Molality")
 
+        # solvent terms are shared by every solute row
+        flow_mol_h2o = self.flow_mol_phase_comp['Liq', 'H2O']
+        mw_h2o = self.mw_comp['H2O']
+
         def rule_molality_comp(b, j):
             return (b.molality_comp[j] ==
                     b.flow_mol_phase_comp['Liq', j]
-                    / b.flow_mol_phase_comp['Liq', 'H2O']
-                    / b.params.mw_comp['H2O'])
+                    / flow_mol_h2o
+                    / mw_h2o)
 
         self.eq_molality_comp = Constraint(self.params.solute_set, rule=rule_molality_comp)
 
@@ -573,6 +624,17 @@ class DSPMDEStateBlockData(StateBlockData):
         add_object_reference(self, "dielectric_constant", self.params.dielectric_constant)
 
     def _act_coeff_phase_comp(self):
+        if self.params.config.activity_coefficient_model == ActivityCoefficientModel.ideal:
+            # activity coefficients of an ideal solution are 1, so no Var or Constraint is needed
+            self.act_coeff_phase_comp = Param(
+                self.phase_list,
+                self.params.solute_set,
+                mutable=True,
+                initialize=1,
+                units=pyunits.dimensionless,
+                doc="activity coefficient of component")
+            return
+
         self.act_coeff_phase_comp = Var(
             self.phase_list,
             self.params.solute_set,
@@ -582,9 +644,7 @@ class DSPMDEStateBlockData(StateBlockData):
             doc="activity coefficient of component")
 
         def rule_act_coeff_phase_comp(b, j):
-            if b.params.config.activity_coefficient_model == ActivityCoefficientModel.ideal:
-                return b.act_coeff_phase_comp['Liq', j] == 1
-            elif b.params.config.activity_coefficient_model == ActivityCoefficientModel.davies:
+            if b.params.config.activity_coefficient_model == ActivityCoefficientModel.davies:
                 raise NotImplementedError(f"Davies model has not been implemented yet.")
         self.eq_act_coeff_phase_comp = Constraint(self.params.solute_set,
                                                   rule=rule_act_coeff_phase_comp)
@@ -599,7 +659,7 @@ class DSPMDEStateBlockData(StateBlockData):
 
         def rule_pressure_osm(b):
             return (b.pressure_osm ==
-                    sum(b.conc_mol_phase_comp['Liq', j] for j in self.params.solute_set)
+                    sum(b.conc_mol_phase_comp['Liq', j] for j in b._solute_tuple)
                     * Constants.gas_constant * b.temperature)
         self.eq_pressure_osm = Constraint(rule=rule_pressure_osm)
 
@@ -643,13 +703,17 @@ class DSPMDEStateBlockData(StateBlockData):
     def assert_electroneutrality(self, tol=None, tee=False):
         if tol is None:
             tol = 1e-6
-            for j in self.params.solute_set:
+            for j in self._solute_tuple:
                 if not self.flow_mol_phase_comp['Liq', j].is_fixed():
                     raise AssertionError(
                         f"{self.flow_mol_phase_comp['Liq', j]} was not fixed. Fix flow_mol_phase_comp for each solute"
                         f" to check that electroneutrality is satisfied.")
-        val = value(sum(self.charge_comp[j] * self.flow_mol_phase_comp['Liq', j]
-                    for j in self.params.solute_set))
+        # reduce numerically rather than building and evaluating a Pyomo sum expression
+        charges = np.fromiter((value(self.charge_comp[j]) for j in self._solute_tuple),
+                              dtype=np.float64, count=len(self._solute_tuple))
+        flows = np.fromiter((value(self.flow_mol_phase_comp['Liq', j]) for j in self._solute_tuple),
+                            dtype=np.float64, count=len(self._solute_tuple))
+        val = _electroneutrality_residual(charges, flows)
         if abs(val) <= tol:
             if tee:
                 return print('Electroneutrality satisfied')
@@ -662,6 +726,16 @@ class DSPMDEStateBlockData(StateBlockData):
     def calculate_scaling_factors(self):
         super().calculate_scaling_factors()
 
+        comps = self._comp_tuple
+        solutes = self._solute_tuple
+
+        # on-demand properties built before scaling, probed once
+        constructed = {name for name in (
+            'pressure_osm', 'mass_frac_phase_comp', 'conc_mass_phase_comp', 'flow_mass_phase_comp',
+            'mole_frac_phase_comp', 'conc_mol_phase_comp', 'act_coeff_phase_comp', 'flow_vol_phase',
+            'flow_vol', 'flow_mass_phase', 'flow_mol_phase', 'molality_comp')
+            if self.is_property_constructed(name)}
+
         # setting scaling factors for variables
 
         # default scaling factors have already been set with
@@ -674,7 +748,7 @@ class DSPMDEStateBlockData(StateBlockData):
             sf = iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', 'H2O'], default=1, warning=True)
             iscale.set_scaling_factor(self.flow_mol_phase_comp['Liq', 'H2O'], sf)
 
-        for j in self.params.solute_set:
+        for j in solutes:
             if iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', j]) is None:
                 sf = iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', j], default=1, warning=True)
                 iscale.set_scaling_factor(self.flow_mol_phase_comp['Liq', j], sf)
@@ -694,105 +768,111 @@ class DSPMDEStateBlockData(StateBlockData):
             if iscale.get_scaling_factor(v) is None:
                 iscale.set_scaling_factor(self.visc_d_phase[p], 1e3)
 
-        if self.is_property_constructed('mole_frac_phase_comp'):
-            for j in self.params.component_list:
-                if iscale.get_scaling_factor(self.mole_frac_phase_comp['Liq', j]) is None:
-                    if j == 'H2O':
-                        iscale.set_scaling_factor(self.mole_frac_phase_comp['Liq', j], 1)
+        # cache the scaling factors reused by the properties below
+        sf_mol = {j: iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', j]) for j in comps}
+        sf_mw = {j: iscale.get_scaling_factor(self.mw_comp[j]) for j in comps}
+        sf_dens = iscale.get_scaling_factor(self.dens_mass_phase['Liq'])
+
+        do_mole_frac = 'mole_frac_phase_comp' in constructed
+        do_conc_mol = 'conc_mol_phase_comp' in constructed
+        do_flow_mass = 'flow_mass_phase_comp' in constructed
+
+        # component mass flows scale as the molar flows times the molecular weights
+        sf_flow_mass = {j: sf_mol[j] * sf_mw[j] for j in comps}
+        if do_flow_mass:
+            for j in comps:
+                sf_flow_mass[j] = iscale.get_scaling_factor(
+                    self.flow_mass_phase_comp['Liq', j], default=sf_flow_mass[j])
+
+        # mass fractions are scaled before the loop, conc_mol_phase_comp is defined through them
+        if 'mass_frac_phase_comp' in constructed:
+            for j in comps:
+                if iscale.get_scaling_factor(self.mass_frac_phase_comp['Liq', j]) is None:
+                    if j in self.params._solvent_components:
+                        iscale.set_scaling_factor(self.mass_frac_phase_comp['Liq', j], 100)
                     else:
-                        sf = (iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', j])
-                              / iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', 'H2O']))
-                        iscale.set_scaling_factor(self.mole_frac_phase_comp['Liq', j], sf)
-
-        if self.is_property_constructed('conc_mol_phase_comp'):
-            for j in self.params.component_list:
-                if iscale.get_scaling_factor(self.conc_mol_phase_comp['Liq', j]) is None:
-                    sf_dens = iscale.get_scaling_factor(self.dens_mass_phase['Liq'])
-                    sf = (sf_dens * iscale.get_scaling_factor(self.mole_frac_phase_comp['Liq', j], default=1)
-                          / iscale.get_scaling_factor(self.mw_comp[j]))
-                    iscale.set_scaling_factor(self.conc_mol_phase_comp['Liq', j], sf)
-
-        if self.is_property_constructed('flow_mass_phase_comp'):
-            for j in self.params.component_list:
-                if iscale.get_scaling_factor(self.flow_mass_phase_comp['Liq', j]) is None:
-                    sf = iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', j], default=1)
-                    sf *= iscale.get_scaling_factor(self.mw_comp[j])
-                    iscale.set_scaling_factor(self.flow_mass_phase_comp['Liq', j], sf)
+                        sf = sf_flow_mass[j] / sf_flow_mass['H2O']
+                        iscale.set_scaling_factor(self.mass_frac_phase_comp['Liq', j], sf)
+
+        # the solvent mole fraction is set before the loop, so the loop only fills in solutes
+        if do_mole_frac and iscale.get_scaling_factor(self.mole_frac_phase_comp['Liq', 'H2O']) is None:
+            iscale.set_scaling_factor(self.mole_frac_phase_comp['Liq', 'H2O'], 1)
+
+        for j in comps:
+            if do_mole_frac and iscale.get_scaling_factor(self.mole_frac_phase_comp['Liq', j]) is None:
+                sf = sf_mol[j] / sf_mol['H2O']
+                iscale.set_scaling_factor(self.mole_frac_phase_comp['Liq', j], sf)
+
+            if do_conc_mol and iscale.get_scaling_factor(self.conc_mol_phase_comp['Liq', j]) is None:
+                if j in self.params._solvent_components:
+                    # solvents typically have a mass fraction between 0.5-1
+                    sf = sf_dens / sf_mw[j]
+                else:
+                    sf = sf_dens * iscale.get_scaling_factor(self.mass_frac_phase_comp['Liq', j]) / sf_mw[j]
+                iscale.set_scaling_factor(self.conc_mol_phase_comp['Liq', j], sf)
+
+            if do_flow_mass and iscale.get_scaling_factor(self.flow_mass_phase_comp['Liq', j]) is None:
+                iscale.set_scaling_factor(self.flow_mass_phase_comp['Liq', j], sf_flow_mass[j])
 
         # these variables do not typically require user input,
         # will not override if the user does provide the scaling factor
-        if self.is_property_constructed('pressure_osm'):
+        if 'pressure_osm' in constructed:
             if iscale.get_scaling_factor(self.pressure_osm) is None:
                 sf = iscale.get_scaling_factor(self.pressure)
                 iscale.set_scaling_factor(self.pressure_osm, sf)
 
-        if self.is_property_constructed('mass_frac_phase_comp'):
-            for j in self.params.component_list:
-                comp = self.params.get_component(j)
-                if iscale.get_scaling_factor(self.mass_frac_phase_comp['Liq', j]) is None:
-                    if comp.is_solute():
-                        sf = (iscale.get_scaling_factor(self.flow_mass_phase_comp['Liq', j], default=1)
-                              / iscale.get_scaling_factor(self.flow_mass_phase_comp['Liq', 'H2O'], default=1))
-                        iscale.set_scaling_factor(self.mass_frac_phase_comp['Liq', j], sf)
-                    elif comp.is_solvent():
-                        iscale.set_scaling_factor(self.mass_frac_phase_comp['Liq', j], 100)
-                    else:
-                        raise TypeError(f'comp={comp}, j = {j}')
-
-        if self.is_property_constructed('flow_vol_phase'):
-            sf = (iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', 'H2O'], default=1)
-                  * iscale.get_scaling_factor(self.mw_comp[j])
-                  / iscale.get_scaling_factor(self.dens_mass_phase['Liq']))
+        if 'flow_vol_phase' in constructed:
+            # the volumetric flow is dominated by the solvent
+            sf = sf_mol['H2O'] * sf_mw['H2O'] / sf_dens
             iscale.set_scaling_factor(self.flow_vol_phase, sf)
 
-        if self.is_property_constructed('flow_vol'):
+        if 'flow_vol' in constructed:
             sf = iscale.get_scaling_factor(self.flow_vol_phase)
             iscale.set_scaling_factor(self.flow_vol, sf)
 
-        if self.is_property_constructed('conc_mass_phase_comp'):
-            for j in self.params.component_list:
-                sf_dens = iscale.get_scaling_factor(self.dens_mass_phase['Liq'])
-                if iscale.get_scaling_factor(self.conc_mass_phase_comp['Liq', j]) is None:
-                    if j == 'H2O':
-                        # solvents typically have a mass fraction between 0.5-1
-                        iscale.set_scaling_factor(self.conc_mass_phase_comp['Liq', j], sf_dens)
-                    else:
-                        iscale.set_scaling_factor(
-                            self.conc_mass_phase_comp['Liq', j],
-                            sf_dens * iscale.get_scaling_factor(self.mass_frac_phase_comp['Liq', j],default=1,warning=True))
+        if 'flow_mass_phase' in constructed:
+            sf = sf_mol['H2O'] * sf_mw['H2O']
+            iscale.set_scaling_factor(self.flow_mass_phase, sf)
 
+        if 'flow_mol_phase' in constructed:
+            iscale.set_scaling_factor(self.flow_mol_phase, sf_mol['H2O'])
 
-        if self.is_property_constructed('molality_comp'):
-            for j in self.params.solute_set:
+        if 'conc_mass_phase_comp' in constructed:
+            # solvents typically have a mass fraction between 0.5-1
+            if iscale.get_scaling_factor(self.conc_mass_phase_comp['Liq', 'H2O']) is None:
+                iscale.set_scaling_factor(self.conc_mass_phase_comp['Liq', 'H2O'], sf_dens)
+            for j in solutes:
+                if iscale.get_scaling_factor(self.conc_mass_phase_comp['Liq', j]) is None:
+                    iscale.set_scaling_factor(
+                        self.conc_mass_phase_comp['Liq', j],
+                        sf_dens * iscale.get_scaling_factor(self.mass_frac_phase_comp['Liq', j],default=1,warning=True))
+
+        if 'molality_comp' in constructed:
+            for j in solutes:
                 if iscale.get_scaling_factor(self.molality_comp[j]) is None:
-                    sf = (iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', j])
-                          / iscale.get_scaling_factor(self.flow_mol_phase_comp['Liq', 'H2O'])
-                          / iscale.get_scaling_factor(self.mw_comp[j]))
+                    sf = sf_mol[j] / sf_mol['H2O'] / sf_mw[j]
                     iscale.set_scaling_factor(self.molality_comp[j], sf)
 
-        if self.is_property_constructed('act_coeff_phase_comp'):
-            for j in self.params.solute_set:
+        if 'act_coeff_phase_comp' in constructed:
+            for j in solutes:
                 if iscale.get_scaling_factor(self.act_coeff_phase_comp['Liq', j]) is None:
                     iscale.set_scaling_factor(self.act_coeff_phase_comp['Liq', j], 1)
 
         # transforming constraints
         # property relationships with no index, simple constraint
-        if self.is_property_constructed('pressure_osm'):
+        if 'pressure_osm' in constructed:
             sf = iscale.get_scaling_factor(self.pressure_osm, default=1, warning=True)
             iscale.constraint_scaling_transform(self.eq_pressure_osm, sf)
 
         # # property relationships with phase index, but simple constraint
-        for v_str in ('flow_vol_phase', 'dens_mass_phase'):
-            if self.is_property_constructed(v_str):
-                v = getattr(self, v_str)
-                sf = iscale.get_scaling_factor(v['Liq'], default=1, warning=True)
-                c = getattr(self, 'eq_' + v_str)
-                iscale.constraint_scaling_transform(c, sf)
+        if 'flow_vol_phase' in constructed:
+            sf = iscale.get_scaling_factor(self.flow_vol_phase['Liq'], default=1, warning=True)
+            iscale.constraint_scaling_transform(self.eq_flow_vol_phase, sf)
 
         # property relationship indexed by component
         v_str_lst_comp = ['molality_comp']
         for v_str in v_str_lst_comp:
-            if self.is_property_constructed(v_str):
+            if v_str in constructed:
                 v_comp = getattr(self, v_str)
                 c_comp = getattr(self, 'eq_' + v_str)
                 for j, c in c_comp.items():
@@ -800,12 +880,15 @@ class DSPMDEStateBlockData(StateBlockData):
                     iscale.constraint_scaling_transform(c, sf)
 
         # property relationships indexed by component and phase
-        v_str_lst_phase_comp = ['mass_frac_phase_comp', 'conc_mass_phase_comp', 'flow_mass_phase_comp',
-                                'mole_frac_phase_comp', 'conc_mol_phase_comp', 'act_coeff_phase_comp']
-        for v_str in v_str_lst_phase_comp:
-            if self.is_property_constructed(v_str):
-                v_comp = getattr(self, v_str)
-                c_comp = getattr(self, 'eq_' + v_str)
-                for j, c in c_comp.items():
+        v_str_lst_phase_comp = ['mass_frac_phase_comp', 'mole_frac_phase_comp', 'conc_mol_phase_comp']
+        # act_coeff_phase_comp is a Param with no constraint for ideal solutions
+        if self.params.config.activity_coefficient_model != ActivityCoefficientModel.ideal:
+            v_str_lst_phase_comp.append('act_coeff_phase_comp')
+        active = [(getattr(self, v_str), getattr(self, 'eq_' + v_str))
+                  for v_str in v_str_lst_phase_comp if v_str in constructed]
+        for j in comps:
+            for v_comp, c_comp in active:
+                # act_coeff_phase_comp is only indexed by solute
+                if j in c_comp:
                     sf = iscale.get_scaling_factor(v_comp['Liq', j], default=1, warning=True)
-                    iscale.constraint_scaling_transform(c, sf)
+                    iscale.constraint_scaling_transform(c_comp[j], sf)
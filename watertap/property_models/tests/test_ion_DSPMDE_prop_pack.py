@@ -20,7 +20,8 @@ from pyomo.environ import (ConcreteModel,
                            Var,
                            units as pyunits,
                            Suffix,
-                           Constraint)
+                           Constraint,
+                           Expression)
 from idaes.core import (FlowsheetBlock,
                         MaterialFlowBasis,
                         PhysicalParameterBlock,
@@ -43,6 +44,7 @@ from idaes.core.util.scaling import unscaled_variables_generator, unscaled_const
 from watertap.property_models.tests.property_test_harness import PropertyAttributeError
 from watertap.property_models.tests.property_test_harness import PropertyTestHarness
 from idaes.core.util import get_solver
+from idaes.core.util.exceptions import ConfigurationError
 
 solver = get_solver()
 # -----------------------------------------------------------------------------
@@ -228,6 +230,65 @@ def test_property_ions(model2):
 
     assert value(stream[0].flow_vol_phase['Liq']) == pytest.approx(1.91524e-5,  rel=1e-3)
 
+@pytest.mark.component
+def test_seawater_conc_mass_scaling():
+    # demanding conc_mass_phase_comp alone builds conc_mol_phase_comp and
+    # mass_frac_phase_comp, which must be scaled consistently with each other
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(default={'dynamic': False})
+    m.fs.properties = DSPMDEParameterBlock(default={
+        "solute_list": ["Ca_2+", "SO4_2-", "Na_+", "Cl_-", "Mg_2+"],
+        "mw_data": {"H2O": 18e-3,
+                    "Na_+": 23e-3,
+                    "Ca_2+": 40e-3,
+                    "Mg_2+": 24e-3,
+                    "Cl_-": 35e-3,
+                    "SO4_2-": 96e-3},
+        "charge": {"Na_+": 1,
+                   "Ca_2+": 2,
+                   "Mg_2+": 2,
+                   "Cl_-": -1,
+                   "SO4_2-": -2},
+    })
+
+    m.fs.stream = stream = m.fs.properties.build_state_block([0], default={'defined_state': True})
+
+    mass_flow_in = 1 * pyunits.kg / pyunits.s
+    feed_mass_frac = {'Na_+': 11122e-6,
+                      'Ca_2+': 382e-6,
+                      'Mg_2+': 1394e-6,
+                      'SO4_2-': 2136e-6,
+                      'Cl_-': 20300e-6}
+    for ion, x in feed_mass_frac.items():
+        mol_comp_flow = x * pyunits.kg / pyunits.kg * mass_flow_in / stream[0].mw_comp[ion]
+        stream[0].flow_mol_phase_comp['Liq', ion].fix(mol_comp_flow)
+
+    H2O_mass_frac = 1 - sum(x for x in feed_mass_frac.values())
+    H2O_mol_comp_flow = H2O_mass_frac * pyunits.kg / pyunits.kg * mass_flow_in / stream[0].mw_comp['H2O']
+    stream[0].flow_mol_phase_comp['Liq', 'H2O'].fix(H2O_mol_comp_flow)
+    stream[0].temperature.fix(298.15)
+    stream[0].pressure.fix(101325)
+
+    stream[0].conc_mass_phase_comp
+    assert stream[0].is_property_constructed('conc_mol_phase_comp')
+    assert not stream[0].is_property_constructed('mole_frac_phase_comp')
+
+    m.fs.properties.set_default_scaling('flow_mol_phase_comp', 1, index=('Liq', 'H2O'))
+    m.fs.properties.set_default_scaling('flow_mol_phase_comp', 1, index=('Liq', 'Na_+'))
+    m.fs.properties.set_default_scaling('flow_mol_phase_comp', 1, index=('Liq', 'Cl_-'))
+    m.fs.properties.set_default_scaling('flow_mol_phase_comp', 1e1, index=('Liq', 'Ca_2+'))
+    m.fs.properties.set_default_scaling('flow_mol_phase_comp', 1e1, index=('Liq', 'SO4_2-'))
+    m.fs.properties.set_default_scaling('flow_mol_phase_comp', 1, index=('Liq', 'Mg_2+'))
+    calculate_scaling_factors(m)
+
+    assert get_scaling_factor(stream[0].conc_mol_phase_comp['Liq', 'H2O']) == pytest.approx(1e-3)
+    assert get_scaling_factor(stream[0].conc_mol_phase_comp['Liq', 'Ca_2+']) == pytest.approx(1e-2)
+
+    stream.initialize()
+
+    badly_scaled_var_list = list(badly_scaled_var_generator(m))
+    assert len(badly_scaled_var_list) == 0
+
 @pytest.fixture(scope="class")
 def model3():
     m = ConcreteModel()
@@ -279,9 +340,8 @@ def test_build(model3):
 
     assert m.fs.stream[0].is_property_constructed('act_coeff_phase_comp')
 
-    var_list = ['mass_frac_phase_comp', 'dens_mass_phase', 'flow_vol_phase',
-                'conc_mass_phase_comp', 'flow_mass_phase_comp', 'mole_frac_phase_comp',
-                'molality_comp', 'pressure_osm', 'act_coeff_phase_comp']
+    var_list = ['mass_frac_phase_comp', 'flow_vol_phase', 'mole_frac_phase_comp',
+                'molality_comp', 'pressure_osm']
 
     # test on demand constraints
     for v in var_list:
@@ -290,8 +350,16 @@ def test_build(model3):
         c = getattr(m.fs.stream[0], 'eq_' + v)
         assert isinstance(c, Constraint)
 
-    assert number_variables(m) == 51
-    assert number_total_constraints(m) == 43
+    # test on demand expressions
+    assert isinstance(m.fs.stream[0].dens_mass_phase, Expression)
+    assert isinstance(m.fs.stream[0].conc_mass_phase_comp, Expression)
+    assert isinstance(m.fs.stream[0].flow_mass_phase_comp, Expression)
+
+    # activity coefficients of an ideal solution are parameters
+    assert isinstance(m.fs.stream[0].act_coeff_phase_comp, Param)
+
+    assert number_variables(m) == 33
+    assert number_total_constraints(m) == 25
     assert number_unused_variables(m) == 1  # pressure is unused
 
 @pytest.mark.unit
@@ -308,6 +376,18 @@ def test_general_methods(model3):
     assert (m.fs.stream[0].get_material_flow_basis()
             is MaterialFlowBasis.molar)
 
+@pytest.mark.unit
+def test_calculate_state_rejects_expressions():
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(default={"dynamic": False})
+    m.fs.properties = DSPMDEParameterBlock(default={"solute_list": ["Na_+", "Cl_-"]})
+    m.fs.stream = m.fs.properties.build_state_block([0], default={'defined_state': True})
+
+    with pytest.raises(ConfigurationError, match="Use conc_mol_phase_comp instead"):
+        m.fs.stream.calculate_state(var_args={('conc_mass_phase_comp', ('Liq', 'Na_+')): 1})
+    with pytest.raises(ConfigurationError, match="Use flow_mol_phase_comp instead"):
+        m.fs.stream.calculate_state(var_args={('flow_mass_phase_comp', ('Liq', 'Na_+')): 1})
+
 @pytest.mark.unit
 def test_default_scaling(model3):
     m = model3
@@ -353,6 +433,11 @@ def test_scaling(model3):
     assert get_scaling_factor(m.fs.stream[0].dens_mass_phase['Liq']) is not None
     assert get_scaling_factor(m.fs.stream[0].visc_d_phase['Liq']) is not None
 
+    # the solvent molar concentration is scaled from the density alone
+    assert get_scaling_factor(m.fs.stream[0].conc_mol_phase_comp['Liq', 'H2O']) == pytest.approx(
+        get_scaling_factor(m.fs.stream[0].dens_mass_phase['Liq'])
+        / get_scaling_factor(m.fs.stream[0].mw_comp['H2O']))
+
 @pytest.mark.component
 def test_seawater_data():
     m = ConcreteModel()
@@ -0,0 +1,56 @@
+###############################################################################
+# WaterTAP Copyright (c) 2021, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National
+# Laboratory, National Renewable Energy Laboratory, and National Energy
+# Technology Laboratory (subject to receipt of any required approvals from
+# the U.S. Dept. of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#
+###############################################################################
+from functools import lru_cache
+
+import pytest
+
+from watertap.core.wt_database import Database
+
+
+@lru_cache(maxsize=None)
+def _database():
+    # one Database per session, shared by the db fixture and the subtype
+    # parametrization below
+    return Database()
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize ``subtype`` over the process subtypes of the technology named
+    by the test class's ``subtype_tech`` attribute, so each subtype gets its
+    own test ID. The database is read when the class is collected rather than
+    when the test module is imported.
+    """
+    tech = getattr(metafunc.cls, "subtype_tech", None)
+    if tech is not None and "subtype" in metafunc.fixturenames:
+        metafunc.parametrize("subtype", list(_database()._get_technology(tech)))
+
+
+@pytest.fixture(scope="session")
+def solver(solver):
+    """
+    The session-scoped solver from watertap/conftest.py. Tests that request
+    it are skipped when the solver executable cannot be found.
+    """
+    if not solver.available(exception_flag=False):
+        pytest.skip("Solver not available")
+    return solver
+
+
+@pytest.fixture(scope="session")
+def db():
+    """
+    Database shared by the zero-order unit model tests. Tests only read
+    from it, so one instance serves the whole session.
+    """
+    return _database()
@@ -21,7 +21,6 @@ from pyomo.environ import (
 from pyomo.util.check_units import assert_units_consistent
 
 from idaes.core import FlowsheetBlock
-from idaes.core.util import get_solver
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.testing import initialization_tester
 
@@ -29,8 +28,6 @@ from watertap.unit_models.zero_order import BioreactorZO
 from watertap.core.wt_database import Database
 from watertap.core.zero_order_properties import WaterParameterBlock
 
-solver = get_solver()
-
 
 class TestBioreactorZO:
     @pytest.fixture(scope="class")
@@ -91,19 +88,25 @@ class TestBioreactorZO:
     def test_initialize(self, model):
         initialization_tester(model)
 
+    @pytest.fixture(scope="class")
+    def solved_model(self, model, solver):
+        # the zero-order solver fixture skips when no solver is available
+        results = solver.solve(model)
+        return model, results
+
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    def test_solve(self, solved_model):
+        _, results = solved_model
 
         # Check for optimal solution
         assert check_optimal_termination(results)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
+    def test_solution(self, solved_model):
+        model, _ = solved_model
+
         assert (pytest.approx(9.7002, rel=1e-3) ==
                 value(model.fs.unit.properties_treated[0].flow_vol))
         assert (pytest.approx(2.0618e-2, rel=1e-3) == value(
@@ -114,12 +117,15 @@ class TestBioreactorZO:
             model.fs.unit.properties_treated[0].conc_mass_comp["foo"]))
         assert (pytest.approx(0, abs=1e-8) == value(model.fs.unit.electricity[0]))
 
-    @pytest.mark.component
-    def test_report(self, model):
+    @pytest.fixture(scope="class")
+    def report_output(self, solved_model):
+        model, _ = solved_model
         stream = StringIO()
-
         model.fs.unit.report(ostream=stream)
+        return stream.getvalue()
 
+    @pytest.mark.component
+    def test_report(self, report_output):
         output = """
 ====================================================================================
 Unit : fs.unit                                                             Time: 0.0
@@ -145,5 +151,5 @@ Unit : fs.unit                                                             Time:
     Mass Concentration foo      0.099970   0.10308
 ====================================================================================
 """
-        assert output in stream.getvalue()
+        assert output.strip() in report_output
 
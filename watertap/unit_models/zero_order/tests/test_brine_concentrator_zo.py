@@ -21,22 +21,18 @@ from pyomo.environ import (
 from pyomo.util.check_units import assert_units_consistent
 
 from idaes.core import FlowsheetBlock
-from idaes.core.util import get_solver
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.testing import initialization_tester
 
 from watertap.unit_models.zero_order import BrineConcentratorZO
-from watertap.core.wt_database import Database
 from watertap.core.zero_order_properties import WaterParameterBlock
 
-solver = get_solver()
-
 
 class TestBrineConcentratorZO_w_o_default_removal:
     @pytest.fixture(scope="class")
-    def model(self):
+    def model(self, db):
         m = ConcreteModel()
-        m.db = Database()
+        m.db = db
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
         m.fs.params = WaterParameterBlock(
@@ -83,19 +79,25 @@ class TestBrineConcentratorZO_w_o_default_removal:
     def test_initialize(self, model):
         initialization_tester(model)
 
+    @pytest.fixture(scope="class")
+    def solved_model(self, model, solver):
+        # the zero-order solver fixture skips when no solver is available
+        results = solver.solve(model)
+        return model, results
+
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    def test_solve(self, solved_model):
+        _, results = solved_model
 
         # Check for optimal solution
         assert check_optimal_termination(results)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
+    def test_solution(self, solved_model):
+        model, _ = solved_model
+
         assert (pytest.approx(9.005, rel=1e-5) ==
                 value(model.fs.unit.properties_treated[0].flow_vol))
         assert (pytest.approx(0.555247, rel=1e-5) == value(
@@ -108,21 +110,25 @@ class TestBrineConcentratorZO_w_o_default_removal:
                 value(model.fs.unit.electricity_intensity[0]))
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_conservation(self, model):
+    def test_conservation(self, solved_model):
+        model, _ = solved_model
+
         for j in model.fs.params.component_list:
             assert 1e-6 >= abs(value(
                 model.fs.unit.inlet.flow_mass_comp[0, j] -
                 model.fs.unit.treated.flow_mass_comp[0, j] -
                 model.fs.unit.byproduct.flow_mass_comp[0, j]))
 
-    @pytest.mark.component
-    def test_report(self, model):
+    @pytest.fixture(scope="class")
+    def report_output(self, solved_model):
+        model, _ = solved_model
         stream = StringIO()
-
         model.fs.unit.report(ostream=stream)
+        return stream.getvalue()
 
+    @pytest.mark.component
+    def test_report(self, report_output):
         output = """
 ====================================================================================
 Unit : fs.unit                                                             Time: 0.0
@@ -145,14 +151,13 @@ Unit : fs.unit                                                             Time:
     Mass Concentration tds 24.390 0.55525    196.79  
 ====================================================================================
 """
-
-        assert output in stream.getvalue()
+        assert output.strip() in report_output
 
 class Testbrine_concentratorZO_w_default_removal:
     @pytest.fixture(scope="class")
-    def model(self):
+    def model(self, db):
         m = ConcreteModel()
-        m.db = Database()
+        m.db = db
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
         m.fs.params = WaterParameterBlock(
@@ -200,19 +205,25 @@ class Testbrine_concentratorZO_w_default_removal:
     def test_initialize(self, model):
         initialization_tester(model)
 
+    @pytest.fixture(scope="class")
+    def solved_model(self, model, solver):
+        # the zero-order solver fixture skips when no solver is available
+        results = solver.solve(model)
+        return model, results
+
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    def test_solve(self, solved_model):
+        _, results = solved_model
 
         # Check for optimal solution
         assert check_optimal_termination(results)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
+    def test_solution(self, solved_model):
+        model, _ = solved_model
+
         assert (pytest.approx(9.006, rel=1e-5) ==
                 value(model.fs.unit.properties_treated[0].flow_vol))
         assert (pytest.approx(0.555185, rel=1e-5) == value(
@@ -229,21 +240,25 @@ class Testbrine_concentratorZO_w_default_removal:
                 value(model.fs.unit.electricity_intensity[0]))
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_conservation(self, model):
+    def test_conservation(self, solved_model):
+        model, _ = solved_model
+
         for j in model.fs.params.component_list:
             assert 1e-6 >= abs(value(
                 model.fs.unit.inlet.flow_mass_comp[0, j] -
                 model.fs.unit.treated.flow_mass_comp[0, j] -
                 model.fs.unit.byproduct.flow_mass_comp[0, j]))
 
-    @pytest.mark.component
-    def test_report(self, model):
+    @pytest.fixture(scope="class")
+    def report_output(self, solved_model):
+        model, _ = solved_model
         stream = StringIO()
-
         model.fs.unit.report(ostream=stream)
+        return stream.getvalue()
 
+    @pytest.mark.component
+    def test_report(self, report_output):
         output = """
 ====================================================================================
 Unit : fs.unit                                                             Time: 0.0
@@ -268,16 +283,15 @@ Unit : fs.unit                                                             Time:
     Mass Concentration foo 0.097551 0.11104  8.0321e-09
 ====================================================================================
 """
-        assert output in stream.getvalue()
-
-
-db = Database()
-params = db._get_technology("brine_concentrator")
+        assert output.strip() in report_output
 
 
 class Testbrine_concentratorZOsubtype:
+    # subtypes are parametrized from the database in conftest.py
+    subtype_tech = "brine_concentrator"
+
     @pytest.fixture(scope="class")
-    def model(self):
+    def model(self, db):
         m = ConcreteModel()
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
@@ -290,9 +304,8 @@ class Testbrine_concentratorZOsubtype:
 
         return m
 
-    @pytest.mark.parametrize("subtype", [params.keys()])
     @pytest.mark.component
-    def test_load_parameters(self, model, subtype):
+    def test_load_parameters(self, model, db, subtype):
         model.fs.unit.config.process_subtype = subtype
         data = db.get_unit_operation_parameters("brine_concentrator", subtype=subtype)
 
@@ -303,7 +316,7 @@ class Testbrine_concentratorZOsubtype:
             assert v.value == data["removal_frac_mass_solute"][j]["value"]
 
 @pytest.mark.unit
-def test_no_tds_in_solute_list_error():
+def test_no_tds_in_solute_list_error(db):
     m = ConcreteModel()
     m.fs = FlowsheetBlock(default={"dynamic": False})
     m.fs.params = WaterParameterBlock(
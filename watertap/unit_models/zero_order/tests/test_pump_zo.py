@@ -13,6 +13,7 @@
 """
 Tests for zero-order pump model
 """
+import numpy as np
 import pytest
 from io import StringIO
 
@@ -20,22 +21,18 @@ from pyomo.environ import ConcreteModel, Constraint, value, Var
 from pyomo.util.check_units import assert_units_consistent
 
 from idaes.core import FlowsheetBlock
-from idaes.core.util import get_solver
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.testing import initialization_tester
 
 from watertap.unit_models.zero_order import PumpZO
-from watertap.core.wt_database import Database
 from watertap.core.zero_order_properties import WaterParameterBlock
 
-solver = get_solver()
-
 
 class TestPumpZOdefault:
     @pytest.fixture(scope="class")
-    def model(self):
+    def model(self, db):
         m = ConcreteModel()
-        m.db = Database()
+        m.db = db
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
         m.fs.params = WaterParameterBlock(
@@ -84,13 +81,14 @@ class TestPumpZOdefault:
         initialization_tester(model)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
+    @pytest.mark.usefixtures("solver")
     @pytest.mark.component
     def test_solution(self, model):
-        for t, j in model.fs.unit.inlet.flow_mass_comp:
-            assert (pytest.approx(value(
-                model.fs.unit.inlet.flow_mass_comp[t, j]), rel=1e-5) ==
-                value(model.fs.unit.outlet.flow_mass_comp[t, j]))
+        inlet = model.fs.unit.inlet.flow_mass_comp
+        outlet = model.fs.unit.outlet.flow_mass_comp
+        inlet_vals = np.fromiter((value(inlet[idx]) for idx in inlet), dtype=np.float64)
+        outlet_vals = np.fromiter((value(outlet[idx]) for idx in inlet), dtype=np.float64)
+        assert np.allclose(inlet_vals, outlet_vals, rtol=1e-5, atol=0)
 
         assert (pytest.approx(1.0060*0.051*3600, rel=1e-5) ==
                 value(model.fs.unit.electricity[0]))
@@ -127,13 +125,12 @@ Unit : fs.unit                                                             Time:
         assert output == stream.getvalue()
 
 
-db = Database()
-params = db._get_technology("pump")
-
-
 class TestPumpZOsubtype:
+    # subtypes are parametrized from the database in conftest.py
+    subtype_tech = "pump"
+
     @pytest.fixture(scope="class")
-    def model(self):
+    def model(self, db):
         m = ConcreteModel()
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
@@ -146,9 +143,8 @@ class TestPumpZOsubtype:
 
         return m
 
-    @pytest.mark.parametrize("subtype", [params.keys()])
     @pytest.mark.component
-    def test_load_parameters(self, model, subtype):
+    def test_load_parameters(self, model, db, subtype):
         model.fs.unit.config.process_subtype = subtype
         data = db.get_unit_operation_parameters("pump", subtype=subtype)
 
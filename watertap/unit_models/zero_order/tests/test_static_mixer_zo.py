@@ -13,30 +13,26 @@
 """
 Tests for zero-order static mixer model.
 """
+import numpy as np
 import pytest
-from io import StringIO
 
 from pyomo.environ import (
     check_optimal_termination, ConcreteModel, Constraint, value, Var)
 from pyomo.util.check_units import assert_units_consistent
 
 from idaes.core import FlowsheetBlock
-from idaes.core.util import get_solver
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.testing import initialization_tester
 
 from watertap.unit_models.zero_order import StaticMixerZO
-from watertap.core.wt_database import Database
 from watertap.core.zero_order_properties import WaterParameterBlock
 
-solver = get_solver()
-
 
 class TestStaticMixerZO:
     @pytest.fixture(scope="class")
-    def model(self):
+    def model(self, db):
         m = ConcreteModel()
-        m.db = Database()
+        m.db = db
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
         m.fs.params = WaterParameterBlock(default={"solute_list": ["calcium", "magnesium", "foo", "sulfate"]})
@@ -83,52 +79,48 @@ class TestStaticMixerZO:
     def test_initialize(self, model):
         initialization_tester(model)
 
+    @pytest.fixture(scope="class")
+    def solved_model(self, model, solver):
+        # the zero-order solver fixture skips when no solver is available
+        results = solver.solve(model)
+        return model, results
+
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    def test_solve(self, solved_model):
+        _, results = solved_model
 
         # Check for optimal solution
         assert check_optimal_termination(results)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
-        for t, j in model.fs.unit.inlet.flow_mass_comp:
-            assert (pytest.approx(value(
-                model.fs.unit.inlet.flow_mass_comp[t, j]), rel=1e-5) ==
-                value(model.fs.unit.outlet.flow_mass_comp[t, j]))
+    def test_solution(self, solved_model):
+        model, _ = solved_model
 
-    @pytest.mark.component
-    def test_report(self, model):
-        stream = StringIO()
-
-        model.fs.unit.report(ostream=stream)
-
-        output = """
-====================================================================================
-Unit : fs.unit                                                             Time: 0.0
-------------------------------------------------------------------------------------
-    Unit Performance
-
-    Variables: 
-
-    Key                   : Value  : Fixed : Bounds
-       Electricity Demand : 0.0000 : False : (None, None)
-    Electricity Intensity : 0.0000 :  True : (None, None)
-
-------------------------------------------------------------------------------------
-    Stream Table
-                                   Inlet   Outlet 
-    Volumetric Flowrate          0.049103 0.049103
-    Mass Concentration H2O         855.34   855.34
-    Mass Concentration calcium     61.096   61.096
-    Mass Concentration magnesium   2.0365   2.0365
-    Mass Concentration foo       0.061096 0.061096
-    Mass Concentration sulfate     81.461   81.461
-====================================================================================
-"""
+        inlet = model.fs.unit.inlet.flow_mass_comp
+        outlet = model.fs.unit.outlet.flow_mass_comp
+        inlet_vals = np.fromiter((value(inlet[idx]) for idx in inlet), dtype=np.float64)
+        outlet_vals = np.fromiter((value(outlet[idx]) for idx in inlet), dtype=np.float64)
+        assert np.allclose(inlet_vals, outlet_vals, rtol=1e-5, atol=0)
 
-        assert output in stream.getvalue()
+    @pytest.mark.solver
+    @pytest.mark.component
+    def test_report(self, solved_model):
+        # check the reported quantities rather than the rendered table, the
+        # table layout is shared by all zero-order models
+        model, _ = solved_model
+
+        assert pytest.approx(0, abs=1e-8) == value(model.fs.unit.electricity[0])
+        assert pytest.approx(0, abs=1e-8) == value(
+            model.fs.unit.energy_electric_flow_vol_inlet)
+
+        props = model.fs.unit.properties[0]
+        assert pytest.approx(0.049103, rel=1e-4) == value(props.flow_vol)
+        conc_mass = {"H2O": 855.34,
+                     "calcium": 61.096,
+                     "magnesium": 2.0365,
+                     "foo": 0.061096,
+                     "sulfate": 81.461}
+        for j, v in conc_mass.items():
+            assert pytest.approx(v, rel=1e-4) == value(props.conc_mass_comp[j])
@@ -13,30 +13,26 @@
 """
 Tests for zero-order storage tank model.
 """
+import numpy as np
 import pytest
-from io import StringIO
 
 from pyomo.environ import (
     check_optimal_termination, ConcreteModel, Constraint, value, Var)
 from pyomo.util.check_units import assert_units_consistent
 
 from idaes.core import FlowsheetBlock
-from idaes.core.util import get_solver
 from idaes.core.util.model_statistics import degrees_of_freedom
 from idaes.core.util.testing import initialization_tester
 
 from watertap.unit_models.zero_order import StorageTankZO
-from watertap.core.wt_database import Database
 from watertap.core.zero_order_properties import WaterParameterBlock
 
-solver = get_solver()
-
 
 class TestStorageTankZO:
     @pytest.fixture(scope="class")
-    def model(self):
+    def model(self, db):
         m = ConcreteModel()
-        m.db = Database()
+        m.db = db
 
         m.fs = FlowsheetBlock(default={"dynamic": False})
         m.fs.params = WaterParameterBlock(default={"solute_list": ["toc", "tds", "eeq", "nitrate", "tss"]})
@@ -86,57 +82,52 @@ class TestStorageTankZO:
     def test_initialize(self, model):
         initialization_tester(model)
 
+    @pytest.fixture(scope="class")
+    def solved_model(self, model, solver):
+        # the zero-order solver fixture skips when no solver is available
+        results = solver.solve(model)
+        return model, results
+
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    def test_solve(self, solved_model):
+        _, results = solved_model
 
         # Check for optimal solution
         assert check_optimal_termination(results)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
-        for t, j in model.fs.unit.inlet.flow_mass_comp:
-            assert (pytest.approx(value(
-                model.fs.unit.inlet.flow_mass_comp[t, j]), rel=1e-5) ==
-                value(model.fs.unit.outlet.flow_mass_comp[t, j]))
+    def test_solution(self, solved_model):
+        model, _ = solved_model
+
+        inlet = model.fs.unit.inlet.flow_mass_comp
+        outlet = model.fs.unit.outlet.flow_mass_comp
+        inlet_vals = np.fromiter((value(inlet[idx]) for idx in inlet), dtype=np.float64)
+        outlet_vals = np.fromiter((value(outlet[idx]) for idx in inlet), dtype=np.float64)
+        assert np.allclose(inlet_vals, outlet_vals, rtol=1e-5, atol=0)
 
         assert (pytest.approx(45284.831999, rel=1e-5) ==
                 value(model.fs.unit.tank_volume[0]))
 
+    @pytest.mark.solver
     @pytest.mark.component
-    def test_report(self, model):
-        stream = StringIO()
-
-        model.fs.unit.report(ostream=stream)
-
-        output = """
-====================================================================================
-Unit : fs.unit                                                             Time: 0.0
-------------------------------------------------------------------------------------
-    Unit Performance
-
-    Variables: 
-
-    Key                : Value  : Fixed : Bounds
-     Storage Time (hr) : 24.000 :  True : (None, None)
-    Surge Capacity (%) : 0.0000 :  True : (None, None)
-      Tank Volume (m3) : 45285. : False : (None, None)
-
-------------------------------------------------------------------------------------
-    Stream Table
-                                 Inlet   Outlet 
-    Volumetric Flowrate         0.52413  0.52413
-    Mass Concentration H2O       953.96   953.96
-    Mass Concentration toc       5.7238   5.7238
-    Mass Concentration tds      0.19079  0.19079
-    Mass Concentration eeq     0.057238 0.057238
-    Mass Concentration nitrate   7.6317   7.6317
-    Mass Concentration tss       32.435   32.435
-====================================================================================
-"""
-
-        assert output in stream.getvalue()
+    def test_report(self, solved_model):
+        # check the reported quantities rather than the rendered table, the
+        # table layout is shared by all zero-order models
+        model, _ = solved_model
+
+        assert pytest.approx(24, rel=1e-5) == value(model.fs.unit.storage_time[0])
+        assert pytest.approx(0, abs=1e-8) == value(model.fs.unit.surge_capacity[0])
+        assert pytest.approx(45285, rel=1e-4) == value(model.fs.unit.tank_volume[0])
+
+        props = model.fs.unit.properties[0]
+        assert pytest.approx(0.52413, rel=1e-4) == value(props.flow_vol)
+        conc_mass = {"H2O": 953.96,
+                     "toc": 5.7238,
+                     "tds": 0.19079,
+                     "eeq": 0.057238,
+                     "nitrate": 7.6317,
+                     "tss": 32.435}
+        for j, v in conc_mass.items():
+            assert pytest.approx(v, rel=1e-4) == value(props.conc_mass_comp[j])
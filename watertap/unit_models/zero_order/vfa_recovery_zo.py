@@ -15,9 +15,6 @@ This module contains a zero-order representation of a general unit that recovers
 operation.
 """
 
-from pyomo.environ import units as pyunits, Var
-from pyomo.common.config import ConfigValue, In
-from idaes.core.util.exceptions import ConfigurationError
 from idaes.core import declare_process_block_class
 from watertap.core import build_sido, constant_intensity, ZeroOrderBaseData
 